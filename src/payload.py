@@ -1,22 +1,98 @@
+import mmap
+import os
 import pickle
-from dataclasses import dataclass
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager, nullcontext
 from datetime import datetime
+from functools import cached_property
 
 import zipfile
 import io
+import logging
 
+import msgpack
+import msgpack_numpy
 import numpy as np
 import pandas as pd
 import trimesh
+import zstandard as zstd
 
 
+log = logging.getLogger(__name__)
+
+# Written to version.txt in every DSB file saved by pld_save. Files without it are legacy (v1) DSB files, whose
+#  entries are stored uncompressed.
+DSB_VERSION = "DSBv2"
+
+_VERSION_ENTRY = "version.txt"
+_ZSTD_SUFFIX = ".zst"
+
+# Buffer size for DSB file I/O. Large enough that zipfile's many small reads and writes are served from one buffer.
+_BUFFER_SIZE = 1 << 20
+
+# Entry names of each payload field, keyed by DSB version (None for legacy files)
+_ENTRY_NAMES = {
+    None: {
+        "mesh": "mesh.stl",
+        "head_centers": "head_centers.pickle",
+        "annotation": "annotation.pickle",
+        "psds": "psds.stl",
+    },
+    DSB_VERSION: {
+        "mesh": "mesh.ply.zst",
+        "head_centers": "head_centers.npy.zst",
+        "annotation": "annotation.msgpack.zst",
+        "psds": "psds.ply.zst",
+    },
+}
+
 
-@dataclass(frozen=True)
 class Payload:
-    dendrite_mesh: trimesh.Trimesh
-    head_centers: np.ndarray
-    annotation: list[tuple[np.ndarray, str]] | None
-    psds: trimesh.Trimesh | None
+    """
+    The contents of a DSB file. Any field may be passed as a Future, in which case it is resolved (blocking until
+    it is done) the first time the field is accessed.
+
+    head_centers is an (N, 3) array in meters. It is float32 when loaded from a DSBv2 file.
+    """
+
+    def __init__(
+            self,
+            dendrite_mesh: trimesh.Trimesh | Future,
+            head_centers: np.ndarray | Future,
+            annotation: list[tuple[np.ndarray, str]] | None | Future,
+            psds: trimesh.Trimesh | None | Future
+    ):
+        self._pending = {
+            "dendrite_mesh": dendrite_mesh,
+            "head_centers": head_centers,
+            "annotation": annotation,
+            "psds": psds,
+        }
+
+    def _resolve(self, field: str):
+        # Only drop the pending entry once it resolved, so a failed load raises its own error on every access and
+        #  concurrent first accesses both find it
+        value = self._pending[field]
+        result = value.result() if isinstance(value, Future) else value
+        self._pending.pop(field, None)
+        return result
+
+    @cached_property
+    def dendrite_mesh(self) -> trimesh.Trimesh:
+        return self._resolve("dendrite_mesh")
+
+    @cached_property
+    def head_centers(self) -> np.ndarray:
+        return self._resolve("head_centers")
+
+    @cached_property
+    def annotation(self) -> list[tuple[np.ndarray, str]] | None:
+        return self._resolve("annotation")
+
+    @cached_property
+    def psds(self) -> trimesh.Trimesh | None:
+        return self._resolve("psds")
 
 
 def pld_save(pld: Payload, filepath: str) -> None:
@@ -26,16 +102,215 @@ def pld_save(pld: Payload, filepath: str) -> None:
     :param filepath: The path to save the payload to
     """
 
-    stl_bytes = pld.dendrite_mesh.export(file_type="stl")
-    head_centers_bytes = pickle.dumps(pld.head_centers)
-    annotation_bytes = pickle.dumps(pld.annotation)
-    psds_stl_bytes = pld.psds.export(file_type="stl") if pld.psds is not None else b""
+    # Binary PLY stores each vertex once instead of once per triangle like STL does, so it is about half the size
+    mesh_bytes = pld.dendrite_mesh.export(file_type="ply", encoding="binary")
+    annotation_bytes = msgpack.packb(pld.annotation, default=msgpack_numpy.encode)
+    psds_bytes = pld.psds.export(file_type="ply", encoding="binary") if pld.psds is not None else b""
+
+    # Store head centers as a raw .npy buffer so loading them is a single copy instead of an unpickle. float32 is
+    #  precise to well under a nanometer at the scale of a dendrite volume, and halves the size of the entry.
+    head_centers_buffer = io.BytesIO()
+    np.save(head_centers_buffer, pld.head_centers.astype(np.float32, copy=False), allow_pickle=False)
+    head_centers_bytes = head_centers_buffer.getvalue()
+
+    entry_names = _ENTRY_NAMES[DSB_VERSION]
+    cctx = zstd.ZstdCompressor(level=3, threads=-1)
+
+    with open(filepath, "wb", buffering=_BUFFER_SIZE) as f, zipfile.ZipFile(f, "w") as zf:
+        zf.writestr(_VERSION_ENTRY, DSB_VERSION)
+        zf.writestr(entry_names["mesh"], cctx.compress(mesh_bytes))
+        zf.writestr(entry_names["head_centers"], cctx.compress(head_centers_bytes))
+        zf.writestr(entry_names["annotation"], cctx.compress(annotation_bytes))
+        zf.writestr(entry_names["psds"], cctx.compress(psds_bytes))
+
+
+class _MappedFile(mmap.mmap):
+    """A read-only memory map that zipfile can read from. mmap only gained seekable() in Python 3.13."""
+
+    def seekable(self) -> bool:
+        return True
+
+
+@contextmanager
+def _open_archive(filepath: str) -> Iterator[zipfile.ZipFile]:
+    """
+    Open a DSB file for reading through a read-only memory map, so zip reads are served directly from the page cache
+    instead of through many small read() calls. Falls back to a buffered file if the file can't be mapped.
+    :param filepath: The path to the DSB file
+    :return: The open DSB zip file
+    """
+
+    with open(filepath, "rb", buffering=_BUFFER_SIZE) as f:
+        try:
+            # Files shorter than the end of central directory record can't be zips. Reading those through the map
+            #  would raise ValueError from seek instead of BadZipFile, so let zipfile reject them from the plain file
+            if os.fstat(f.fileno()).st_size < zipfile.sizeEndCentDir:
+                raise ValueError("file too short to be a zip file")
+            source = _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Some filesystems (and empty files) can't be memory mapped, so fall back to large buffered reads
+            source = nullcontext(f)
+
+        with source as source_file, zipfile.ZipFile(source_file, "r") as zf:
+            yield zf
+
+
+def _read_version(zf: zipfile.ZipFile) -> str | None:
+    """
+    Read the DSB version of an open DSB file.
+    :param zf: The open DSB zip file
+    :return: The version string, or None for legacy (v1) DSB files
+    """
+
+    if _VERSION_ENTRY not in zf.namelist():
+        return None
+
+    version = zf.read(_VERSION_ENTRY).decode("utf-8").strip()
+
+    if version not in _ENTRY_NAMES:
+        raise ValueError(f"Unsupported DSB version: {version}")
+
+    return version
+
+
+def _read_entry(zf: zipfile.ZipFile, name: str) -> bytes:
+    """
+    Read an entry from an open DSB file, decompressing it on the fly if it is Zstd-compressed. The compressed bytes
+    are streamed from the archive rather than read into memory first.
+    :param zf: The open DSB zip file
+    :param name: The name of the entry to read
+    :return: The decompressed entry bytes
+    """
+
+    with zf.open(name) as f:
+        if name.endswith(_ZSTD_SUFFIX):
+            return zstd.ZstdDecompressor().stream_reader(f).read()
+
+        return f.read()
+
+
+def _load_mesh(zf: zipfile.ZipFile, name: str) -> trimesh.Trimesh | None:
+    """
+    Deserialize a mesh entry.
+    :param zf: The open DSB zip file
+    :param name: The name of the entry, whose extension gives the mesh format (STL or PLY)
+    :return: The mesh, or None if the entry is empty
+    """
+
+    file_type = name.removesuffix(_ZSTD_SUFFIX).rsplit(".", 1)[-1]
+
+    if not name.endswith(_ZSTD_SUFFIX):
+        # Uncompressed (legacy) meshes are parsed straight from the zip stream without copying them out first
+        if zf.getinfo(name).file_size == 0:
+            return None
+
+        with zf.open(name) as f:
+            return trimesh.load(f, force="mesh", file_type=file_type)
+
+    data = _read_entry(zf, name)
+
+    if not data:
+        return None
+
+    return trimesh.load(io.BytesIO(data), force="mesh", file_type=file_type)
+
+
+def _load_head_centers(zf: zipfile.ZipFile, name: str) -> np.ndarray:
+    """
+    Deserialize the head centers entry.
+    :param zf: The open DSB zip file
+    :param name: The name of the entry, which determines its format
+    :return: The head centers
+    """
+
+    data = _read_entry(zf, name)
+
+    if name.startswith("head_centers.pickle"):
+        return pickle.loads(data)
+
+    return np.load(io.BytesIO(data), allow_pickle=False)
+
+
+def _load_annotation(zf: zipfile.ZipFile, name: str) -> list[tuple[np.ndarray, str]] | None:
+    """
+    Deserialize the annotation entry.
+    :param zf: The open DSB zip file
+    :param name: The name of the entry, which determines its format
+    :return: The annotation
+    """
+
+    data = _read_entry(zf, name)
+
+    if name.startswith("annotation.pickle"):
+        return pickle.loads(data)
+
+    annotation = msgpack.unpackb(data, object_hook=msgpack_numpy.decode)
+
+    if annotation is None:
+        return None
+
+    # msgpack has no tuple type, so the (point, name) pairs come back as lists
+    return [tuple(item) for item in annotation]
+
+
+def _close_when_done(futures: list[Future], stack: ExitStack) -> None:
+    """
+    Close everything on stack once all futures are done.
+    :param futures: The futures to wait for
+    :param stack: The exit stack to close
+    """
+
+    wait(futures)
+    stack.close()
 
-    with zipfile.ZipFile(filepath, "w") as zf:
-        zf.writestr("mesh.stl", stl_bytes)
-        zf.writestr("head_centers.pickle", head_centers_bytes)
-        zf.writestr("annotation.pickle", annotation_bytes)
-        zf.writestr("psds.stl", psds_stl_bytes)
+
+def _start_load(filepath: str, csv_base_filename: str | None) -> tuple[Payload, Future | None]:
+    """
+    Open a DSB file once and start decoding its payload, and optionally its latest CSV, in the background.
+    :param filepath: The path to the DSB file
+    :param csv_base_filename: Base name of the CSV files to find the latest of, or None to skip reading CSVs
+    :return: The payload, and a future for the latest CSV (None if csv_base_filename is None)
+    """
+
+    stack = ExitStack()
+
+    try:
+        zf = stack.enter_context(_open_archive(filepath))
+
+        version = _read_version(zf)
+        entry_names = _ENTRY_NAMES[version]
+    except BaseException:
+        stack.close()
+        raise
+
+    log.debug("Loading %s (version %s)", filepath, version or "legacy")
+
+    # Reading, decompression and parsing spend most of their time outside the GIL, so decode the entries concurrently.
+    #  Each worker streams its entry straight out of the shared archive.
+    executor = ThreadPoolExecutor(max_workers=len(entry_names) + 1)
+
+    futures = {
+        "dendrite_mesh": executor.submit(_load_mesh, zf, entry_names["mesh"]),
+        "annotation": executor.submit(_load_annotation, zf, entry_names["annotation"]),
+        "psds": executor.submit(_load_mesh, zf, entry_names["psds"]),
+        "head_centers": executor.submit(_load_head_centers, zf, entry_names["head_centers"]),
+    }
+    pending = list(futures.values())
+
+    csv_future = None
+    if csv_base_filename is not None:
+        csv_future = executor.submit(_get_latest_csv_from_zf, zf, csv_base_filename)
+        pending.append(csv_future)
+
+    # The archive has to stay open until every entry is read. Queued behind the reading tasks, this runs as soon as a
+    #  worker frees up, then waits for the rest.
+    executor.submit(_close_when_done, pending, stack)
+
+    # Don't wait for the decoding to finish. It continues in the background while the caller gets on with other
+    #  work, and each field only blocks if it is accessed before its entry is decoded.
+    executor.shutdown(wait=False)
+
+    return Payload(**futures), csv_future
 
 
 def pld_load(filepath: str) -> Payload:
@@ -45,39 +320,39 @@ def pld_load(filepath: str) -> Payload:
     :return: The loaded payload
     """
 
-    with zipfile.ZipFile(filepath, "r") as zf:
-        mesh_bytes = zf.read("mesh.stl")
-        annotation_bytes = zf.read("annotation.pickle")
-        head_centers_bytes = zf.read("head_centers.pickle")
-        psds_bytes = zf.read("psds.stl")
+    pld, _ = _start_load(filepath, None)
+    return pld
+
 
-    head_centers = pickle.loads(head_centers_bytes)
-    dendrite_mesh = trimesh.load(io.BytesIO(mesh_bytes), force="mesh", file_type="stl")
-    annotation = pickle.loads(annotation_bytes)
-    psds = trimesh.load(io.BytesIO(psds_bytes), force="mesh", file_type="stl") if psds_bytes else None
+def open_dsb(filepath: str, csv_base_filename: str) -> tuple[Payload, pd.DataFrame | None]:
+    """
+    Load the payload and the latest saved CSV from a DSB file, opening it only once.
+    :param filepath: The path to the DSB file
+    :param csv_base_filename: Base name for the CSV file (without timestamp)
+    :return: The loaded payload, and a DataFrame with the latest CSV data or None if no CSV found
+    """
 
-    return Payload(
-        dendrite_mesh=dendrite_mesh,
-        annotation=annotation,
-        psds=psds,
-        head_centers=head_centers
-    )
+    pld, csv_future = _start_load(filepath, csv_base_filename)
+    return pld, csv_future.result()
 
 
-def save_csv_to_dsb(dsb_filepath: str, csv_data: pd.DataFrame, base_filename: str) -> str:
+def save_csv_to_dsb(dsb_filepath: str, csv_data: pd.DataFrame | bytes, base_filename: str) -> str:
     """
     Save a CSV file to the DSB file with a timestamp.
 
     :param dsb_filepath: Path to the .dsb file
-    :param csv_data: DataFrame containing the CSV data
+    :param csv_data: DataFrame containing the CSV data, or the already serialized UTF-8 CSV bytes
     :param base_filename: Base name for the CSV file (without extension)
     :return: The filename used in the DSB
     """
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     csv_filename = f"{base_filename}_{timestamp}.csv"
 
-    # Convert DataFrame to CSV bytes
-    csv_bytes = csv_data.to_csv(index=False).encode('utf-8')
+    # Convert DataFrame to CSV bytes unless the caller has already serialized it
+    if isinstance(csv_data, bytes):
+        csv_bytes = csv_data
+    else:
+        csv_bytes = csv_data.to_csv(index=False, lineterminator='\n').encode('utf-8')
 
     # Append to existing DSB file
     with zipfile.ZipFile(dsb_filepath, "a") as zf:
@@ -94,20 +369,31 @@ def get_latest_csv_from_dsb(dsb_filepath: str, base_filename: str) -> pd.DataFra
     :param base_filename: Base name for the CSV file (without timestamp)
     :return: DataFrame with the latest CSV data, or None if no CSV found
     """
-    with zipfile.ZipFile(dsb_filepath, "r") as zf:
-        # Find all CSV files matching the base filename pattern
-        csv_files = [name for name in zf.namelist()
-                     if name.startswith(base_filename) and name.endswith('.csv')]
+    with _open_archive(dsb_filepath) as zf:
+        return _get_latest_csv_from_zf(zf, base_filename)
 
-        if not csv_files:
-            return None
 
-        # Sort by timestamp (embedded in filename) to get the latest
-        csv_files.sort(reverse=True)
-        latest_csv = csv_files[0]
+def _get_latest_csv_from_zf(zf: zipfile.ZipFile, base_filename: str) -> pd.DataFrame | None:
+    """
+    Get the latest CSV file from an open DSB file based on timestamp.
+
+    :param zf: The open DSB zip file
+    :param base_filename: Base name for the CSV file (without timestamp)
+    :return: DataFrame with the latest CSV data, or None if no CSV found
+    """
+    # Find all CSV files matching the base filename pattern
+    csv_files = [name for name in zf.namelist()
+                 if name.startswith(base_filename) and name.endswith('.csv')]
+
+    if not csv_files:
+        return None
+
+    # Sort by timestamp (embedded in filename) to get the latest
+    csv_files.sort(reverse=True)
+    latest_csv = csv_files[0]
 
-        # Read the CSV
-        csv_bytes = zf.read(latest_csv)
-        csv_data = pd.read_csv(io.BytesIO(csv_bytes))
+    # Read the CSV
+    csv_bytes = zf.read(latest_csv)
+    csv_data = pd.read_csv(io.BytesIO(csv_bytes))
 
-        return csv_data
+    return csv_data
@@ -2,12 +2,18 @@
 Main entry point for the DSB spine head center proofreading tool.
 """
 
+import argparse
+import logging
 from pathlib import Path
 
+import numpy as np
+
 from .gui import FileSelectionGUI
 from .visualizer import SpineProofreadVisualizer
 from . import payload
 
+log = logging.getLogger(__name__)
+
 
 def load_and_visualize(file_path):
     """
@@ -15,18 +21,18 @@ def load_and_visualize(file_path):
 
     :param file_path: Path to the .dsb file
     """
-    pld = payload.pld_load(file_path)
-    original_head_centers_scaled = pld.head_centers * 1e9  # Convert m -> nm
-
-    # Try to load the latest saved state from the DSB file
+    # Load the payload and try to load the latest saved state from the DSB file
     input_path = Path(file_path)
     base_filename = f"{input_path.stem}_proofread"
-    latest_csv = payload.get_latest_csv_from_dsb(file_path, base_filename)
+    pld, latest_csv = payload.open_dsb(file_path, base_filename)
+
+    # Convert m -> nm. Head centers are stored as float32, but the positions are edited and saved, so work in float64
+    original_head_centers_scaled = pld.head_centers.astype(np.float64) * 1e9
 
     # Prepare initial state
     if latest_csv is not None:
         # Load from saved state
-        print(f"Loading previous proofreading session from DSB file...")
+        log.info("Loading previous proofreading session from DSB file...")
         head_centers_scaled = latest_csv[['PosX', 'PosY', 'PosZ']].values
         labels = latest_csv['status'].tolist()
         spine_names = latest_csv['Name'].tolist()
@@ -34,7 +40,7 @@ def load_and_visualize(file_path):
         radii = latest_csv['Radius'].tolist() if 'Radius' in latest_csv.columns else None
     else:
         # Start fresh
-        print(f"Starting new proofreading session...")
+        log.info("Starting new proofreading session...")
         head_centers_scaled = original_head_centers_scaled.copy()
         labels = None
         spine_names = None
@@ -63,6 +69,15 @@ def load_and_visualize(file_path):
 
 def main():
     """Main entry point for the proofreading tool."""
+    parser = argparse.ArgumentParser(description="DSB spine head center proofreading tool")
+    parser.add_argument("--debug", action="store_true", help="Show debug log messages")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="[%(levelname)s] %(name)s: %(message)s"
+    )
+
     gui = FileSelectionGUI()
     gui.run(on_start_callback=load_and_visualize)
 
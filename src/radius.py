@@ -1,11 +1,52 @@
 import numpy as np
+import functools
 import numbers
+import weakref
 
 import ncollpyde
 import scipy
 
 from skeletor.post.radiusextraction import fibonacci_sphere
 
+# Ray casting volumes and KD-trees are expensive to build, so they are built once per mesh and reused. Keyed by
+#  id(mesh); entries are evicted when their mesh is garbage collected.
+_volume_cache: dict[int, ncollpyde.Volume] = {}
+_kdtree_cache: dict[int, scipy.spatial.cKDTree] = {}
+
+
+def _get_cached(cache, mesh, build):
+    """Get the cached object for mesh from cache, building it with build() on a miss."""
+    key = id(mesh)
+
+    if key not in cache:
+        cache[key] = build()
+        weakref.finalize(mesh, cache.pop, key, None)
+
+    return cache[key]
+
+
+def clear_geometry_caches():
+    """
+    Drop all cached ray casting volumes and KD-trees. Call this if a mesh passed to this module is modified in place.
+    """
+    _volume_cache.clear()
+    _kdtree_cache.clear()
+
+
+@functools.lru_cache(maxsize=16)
+def _fibonacci_sphere(n):
+    """
+    Unit sphere sample points for n rays. Cached, since generating them is a Python loop. The samples are not
+    randomized so that radii are reproducible.
+
+    :param n: The number of points
+    :return: A read-only (n, 3) array of points on the unit sphere
+    """
+    points = fibonacci_sphere(n, randomize=False)
+    points.setflags(write=False)
+
+    return points
+
 
 def interpolate_along_path(points, spacing):
     """
@@ -82,6 +123,50 @@ def rotate_points_to_normal(points, target_normal):
     return points.dot(R.T)  # Apply rotation and return
 
 
+def rotation_matrices_to_normals(target_normals):
+    """
+    Builds, for each target normal, the rotation matrix that aligns the plane normal [0, 0, 1] with it. This is the
+    batched equivalent of rotate_points_to_normal, using Rodrigues' formula on all normals at once.
+
+    Parameters:
+        target_normals (np.ndarray): Array of shape (N, 3) of 3D vectors representing the desired normals.
+
+    Returns:
+        np.ndarray: Array of shape (N, 3, 3) of rotation matrices.
+    """
+
+    target_normals = target_normals / np.linalg.norm(target_normals, axis=1, keepdims=True)
+
+    # Rotation axis is the cross product [0, 0, 1] x target_normal
+    axis = np.cross([0, 0, 1], target_normals)
+    axis_norm = np.linalg.norm(axis, axis=1)
+
+    # Parallel and antiparallel normals have no rotation axis. Leave their axis at zero, which makes K zero and R the
+    #  identity, then fix up the antiparallel ones below.
+    is_parallel = np.isclose(axis_norm, 0)
+    axis[~is_parallel] /= axis_norm[~is_parallel, np.newaxis]
+
+    theta = np.arccos(np.clip(target_normals[:, 2], -1.0, 1.0))  # Rotation angle
+
+    # Skew-symmetric matrices of the rotation axes
+    K = np.zeros((len(target_normals), 3, 3))
+    K[:, 0, 1] = -axis[:, 2]
+    K[:, 0, 2] = axis[:, 1]
+    K[:, 1, 0] = axis[:, 2]
+    K[:, 1, 2] = -axis[:, 0]
+    K[:, 2, 0] = -axis[:, 1]
+    K[:, 2, 1] = axis[:, 0]
+
+    # Rodrigues' rotation formula: R = I + sin(theta)*K + (1-cos(theta))*K^2
+    R = (np.eye(3)
+         + np.sin(theta)[:, np.newaxis, np.newaxis] * K
+         + (1 - np.cos(theta))[:, np.newaxis, np.newaxis] * np.einsum('nij,njk->nik', K, K))
+
+    # Rotate 180 degrees around the x-axis if the normals are antiparallel
+    R[is_parallel & (target_normals[:, 2] < 0)] = np.diag([1.0, -1.0, -1.0])
+
+    return R
+
 
 def polyline_tangents(points):
     """
@@ -137,24 +222,61 @@ def get_radius_knn(coords, mesh, n=5, aggregate='mean'):
     assert aggregate in agg_map
     agg_func = agg_map[aggregate]
 
-    # Generate kdTree
-    tree = scipy.spatial.cKDTree(mesh.vertices)
+    # Generate kdTree (or reuse the one built for this mesh). An unbalanced tree without compacted nodes builds about
+    #  twice as fast, at a slight cost in query speed
+    tree = _get_cached(
+        _kdtree_cache, mesh,
+        lambda: scipy.spatial.cKDTree(mesh.vertices, balanced_tree=False, compact_nodes=False)
+    )
 
-    # Query for coordinates
-    dist, ix = tree.query(coords, k=5)
+    # Query for coordinates, in parallel over all cores. Reshape since the neighbor axis is dropped when n == 1
+    dist, ix = tree.query(coords, k=n, workers=-1)
+    dist = dist.reshape(-1, n)
 
     # Aggregate
     return agg_func(dist, axis=1)
 
 
-def get_radius_point(point: np.ndarray, mesh, n_rays=20, aggregate='mean', projection='sphere', fallback='knn'):
+def _aggregate_buckets(values, starts, counts, aggregate):
     """
-    Extract radii using ray casting.
+    Aggregate consecutive buckets of values, without a Python loop over the buckets.
+
+    :param values: 1D array of values, grouped into consecutive buckets.
+    :param starts: The index in values at which each bucket starts.
+    :param counts: The number of values in each bucket. Must all be nonzero.
+    :param aggregate: "mean" | "median" | "max" | "min" | "percentile75" | "percentile99"
+    :return: An array with the aggregated value of each bucket.
+    """
+
+    if aggregate == 'mean':
+        return np.add.reduceat(values, starts) / counts
+
+    if aggregate == 'max':
+        return np.maximum.reduceat(values, starts)
+
+    if aggregate == 'min':
+        return np.minimum.reduceat(values, starts)
+
+    # Percentiles have no reduceat, so lay the buckets out as rows of a NaN-padded matrix and reduce along the rows
+    q = {'median': 50, 'percentile75': 75, 'percentile99': 99}[aggregate]
+
+    rows = np.repeat(np.arange(len(starts)), counts)
+    cols = np.arange(len(values)) - np.repeat(starts, counts)
+
+    padded = np.full((len(starts), counts.max()), np.nan)
+    padded[rows, cols] = values
+
+    return np.nanpercentile(padded, q, axis=1)
+
+
+def get_radius_points(points: np.ndarray, mesh, n_rays=20, aggregate='mean', projection='sphere', fallback='knn'):
+    """
+    Extract radii using ray casting. All points are processed in a single batch.
 
     Parameters
     ----------
-    point :      np.ndarray
-                    A 3-element array describing a 3D point
+    points :        np.ndarray
+                    An (N, 3) array of 3D points
     mesh :          trimesh.Trimesh
     n_rays :        int
                     Number of rays to cast for each node.
@@ -170,39 +292,36 @@ def get_radius_point(point: np.ndarray, mesh, n_rays=20, aggregate='mean', proje
                     ignore those cases (``None``), assign an arbitrary number or
                     we can fall back to radii from k-nearest-neighbors (``knn``).
 
-    path_interpolation_spacing: The distance between points on the path (polyline) to sample.
-
-    :returns radius at point
+    :returns (N,) array of radii at each point
 
     """
-    agg_map = {'mean': np.mean, 'max': np.max, 'min': np.min,
-               'median': np.median, 'percentile75': lambda x: np.percentile(x, 75), 'percentile99': lambda x: np.percentile(x, 99)}
-    assert aggregate in agg_map
-    agg_func = agg_map[aggregate]
-
+    assert aggregate in ['mean', 'max', 'min', 'median', 'percentile75', 'percentile99']
     assert projection in ['sphere', 'tangents']
     assert (fallback == 'knn') or isinstance(fallback, numbers.Number) or isinstance(fallback, type(None))
 
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    n_points = len(points)
+
     # Get max dimension of mesh
     dim = mesh.vertices.max(axis=0) - mesh.vertices.min(axis=0)
     radius = max(dim)
 
-    # Vertices for each point on the circle
-    sources = np.repeat(np.array([point]), n_rays, axis=0)
+    # Vertices for each point on the circle: n_rays consecutive sources per point
+    sources = np.repeat(points, n_rays, axis=0)
 
     if projection == 'sphere':
-        targets = fibonacci_sphere(n_rays, randomize=True) * radius  # Uniform sphere points sphere scaled by radius
-        targets = np.tile(targets, (1, 1))  # Reshape to match sources
-        targets += sources # Offset onto sources
+        sphere = _fibonacci_sphere(n_rays) * radius  # Uniform sphere points sphere scaled by radius
+
+        # Offset onto sources, broadcasting the one sphere over every point rather than tiling copies of it
+        targets = (sources.reshape(n_points, n_rays, 3) + sphere).reshape(-1, 3)
     else:
-        tangents = polyline_tangents(np.array([point]))
+        tangents = polyline_tangents(points)
 
         # Follow these steps:
         #  1. Create a unit disk of n_rays points along axes x and y
         #  2. Scale the unit disk by radius
-        #  3. Duplicate the disk by the number of points to equal the length of sources: shape [len(points), n_rays, 3]
-        #  4. Rotate the unit disk to align with the tangent vector
-        #  5. Define a targets array by adding the rotated disk to the sources
+        #  3. Rotate the shared disk to align with every tangent vector at once: shape [len(points), n_rays, 3]
+        #  4. Define a targets array by adding the rotated disks to the sources
 
         # Step 1
         zero_to_2pi = np.linspace(0, 2 * np.pi, n_rays, endpoint=False)
@@ -212,49 +331,76 @@ def get_radius_point(point: np.ndarray, mesh, n_rays=20, aggregate='mean', proje
         disk *= radius
 
         # Step 3
-        disk = np.repeat(disk[np.newaxis, :, :], 1, axis=0)
+        rotations = rotation_matrices_to_normals(tangents)
+        disks = np.einsum('nij,mj->nmi', rotations, disk)
 
-        # Step 4
-        for i, tangent in enumerate(tangents):
-            disk[i] = rotate_points_to_normal(disk[i], tangent)
+        # Step 4: offset the rotated disks onto the sources in place
+        targets = disks.reshape(-1, 3)
+        targets += sources
 
-        # Step 5
-        disk = disk.reshape(-1, 3)
-        targets = sources + disk
+    # Initialize ncollpyde Volume (or reuse the one built for this mesh)
+    coll = _get_cached(_volume_cache, mesh, lambda: ncollpyde.Volume(mesh.vertices, mesh.faces, validate=False))
 
-    # Initialize ncollpyde Volume
-    coll = ncollpyde.Volume(mesh.vertices, mesh.faces, validate=False)
+    # Get intersections for every ray of every point in one call: `ix` points to index of line segment; `loc` is the
+    #  x/y/z coordinate of the intersection and `is_backface` is True if intersection happened at the inside of a mesh.
+    #  ncollpyde's threaded implementation converts its inputs to Python lists, which is slower than the array one
+    ix, loc, is_backface = coll.intersections(sources, targets, threads=False)
 
-    # Get intersections: `ix` points to index of line segment; `loc` is the
-    #  x/y/z coordinate of the intersection and `is_backface` is True if
-    # intersection happened at the inside of a mesh
-    ix, loc, is_backface = coll.intersections(sources, targets)
+    # Calculate intersection distances, reusing the gathered sources as scratch space. `loc` is flat if nothing was
+    #  hit at all
+    offsets = sources[ix]
+    offsets -= loc.reshape(-1, 3)
+    dist = np.sqrt(np.einsum('ij,ij->i', offsets, offsets))
 
-    # Calculate intersection distances
-    dist = np.sqrt(np.sum((sources[ix] - loc) ** 2, axis=1))
+    # Map from `ix` back to index of original point, and group the hits of each point together
+    org_ix = ix // n_rays
+    order = np.argsort(org_ix, kind='stable')
+    org_ix = org_ix[order]
+    dist = dist[order]
+    is_backface = is_backface[order]
 
-    # Map from `ix` back to index of original point
-    org_ix = (ix / n_rays).astype(int)
+    hit_ix, bucket_starts, counts = np.unique(org_ix, return_index=True, return_counts=True)
 
-    # Split by original index
-    split_ix = np.where(org_ix[:-1] - org_ix[1:])[0]
-    split = np.split(dist, split_ix)
+    # Aggregate over each original ix. Points whose rays hit nothing keep a distance of 0
+    final_dist = np.zeros(n_points)
 
-    # Aggregate over each original ix
-    final_dist = np.zeros(1)
-    for l, i in zip(split, np.unique(org_ix)):
-        final_dist[i] = agg_func(l)
+    if len(hit_ix) > 0:
+        final_dist[hit_ix] = _aggregate_buckets(dist, bucket_starts, counts, aggregate)
 
     if not isinstance(fallback, type(None)):
-        # See if any needs fixing
-        inside = coll.contains(np.array([point]))
-        is_zero = final_dist == 0
-        needs_fix = ~inside | is_zero
+        # See if any needs fixing. Points with no hits always do
+        needs_fix = final_dist == 0
+
+        if len(hit_ix) > 0:
+            # Rays from a point inside the mesh first hit the inside of a face, and rays from outside hit the
+            #  outside of one. The hits already tell us whether most points are inside, so the containment query
+            #  (another BVH traversal) only runs for points whose hits disagree, e.g. ones right on the surface.
+            backface_hits = np.add.reduceat(is_backface.astype(np.intp), bucket_starts)
+            needs_fix[hit_ix[backface_hits == 0]] = True
+
+            is_mixed = (backface_hits > 0) & (backface_hits < counts)
+
+            if is_mixed.any():
+                mixed_ix = hit_ix[is_mixed]
+                needs_fix[mixed_ix] |= ~coll.contains(points[mixed_ix])
 
         if any(needs_fix):
             if isinstance(fallback, numbers.Number):
                 final_dist[needs_fix] = fallback
             elif fallback == 'knn':
-                final_dist[needs_fix] = get_radius_knn(np.array([point]), mesh, aggregate=aggregate)
+                final_dist[needs_fix] = get_radius_knn(points[needs_fix], mesh, aggregate=aggregate)
+
+    return final_dist
+
+
+def get_radius_point(point: np.ndarray, mesh, n_rays=20, aggregate='mean', projection='sphere', fallback='knn'):
+    """
+    Extract the radius at a single point using ray casting. See get_radius_points for the parameters.
+
+    :param point: A 3-element array describing a 3D point
+    :returns radius at point
+    """
 
-    return final_dist[0]
\ No newline at end of file
+    return get_radius_points(
+        np.array([point]), mesh, n_rays=n_rays, aggregate=aggregate, projection=projection, fallback=fallback
+    )[0]
@@ -2,17 +2,44 @@
 PyVista-based 3D visualizer for proofreading spine head center candidates.
 """
 
+import logging
+import math
+
 import numpy as np
 import pandas as pd
 import pyvista as pv
 from pathlib import Path
 from pyvistaqt import QtInteractor
 from qtpy import QtWidgets, QtCore
+from scipy.spatial import cKDTree
+from vtkmodules.vtkCommonDataModel import vtkDataObject
+from vtkmodules.vtkFiltersCore import vtkThresholdPoints
+from vtkmodules.vtkRenderingCore import vtkGlyph3DMapper
 from datetime import datetime
 
 from . import radius
 from . import payload
 
+log = logging.getLogger(__name__)
+
+# Number of points ray cast per radius.get_radius_points call when computing radii in bulk
+RADIUS_BATCH_SIZE = 64
+
+# Number of points per ray cast in the background prefetcher. Kept small so each cast, which holds the GIL, fits within
+#  a frame
+PREFETCH_BATCH_SIZE = 4
+
+# 8-bit RGB values of the named colors used for scene objects, resolved once instead of on every update
+COLOR_RGB = {name: pv.Color(name).int_rgb for name in ('gray', 'green', 'red', 'blue', 'gold', 'white')}
+
+# Point labels are stored as int8 codes; LABEL_NAMES decodes them back to the strings saved in the CSV
+UNLABELED, ACCEPTED, REJECTED = 0, 1, 2
+LABEL_NAMES = np.array(['unlabeled', 'accepted', 'rejected'], dtype=object)
+LABEL_CODES = {name: code for code, name in enumerate(LABEL_NAMES)}
+
+# Sphere color for each label code, indexable by an array of codes
+LABEL_COLORS = np.array([COLOR_RGB['gray'], COLOR_RGB['green'], COLOR_RGB['red']], dtype=np.uint8)
+
 
 class FocusLineEdit(QtWidgets.QLineEdit):
     """Custom QLineEdit that emits signals on focus in/out."""
@@ -31,6 +58,50 @@ class FocusLineEdit(QtWidgets.QLineEdit):
         super().focusOutEvent(event)
 
 
+class RadiusPrefetcher(QtCore.QThread):
+    """
+    Background thread that fills in uncached head radii so navigation rarely has to compute one.
+
+    ncollpyde holds the GIL for the duration of each ray cast, so the GUI thread is blocked while a batch is being
+    cast. Batches are therefore kept small and the thread briefly sleeps between them, which keeps input and rendering
+    responsive at the cost of a slower prefetch.
+    """
+
+    progress = QtCore.Signal(int)  # Emits the number of points processed so far
+
+    def __init__(self, visualizer, parent=None):
+        """
+        :param visualizer: The SpineProofreadVisualizer whose head_radii should be filled in.
+        :param parent: Optional parent QObject.
+        """
+        super().__init__(parent)
+        self.visualizer = visualizer
+
+    def run(self):
+        """Compute missing radii batch by batch until done or interrupted."""
+        vis = self.visualizer
+
+        for start in range(0, vis.num_points, PREFETCH_BATCH_SIZE):
+            if self.isInterruptionRequested():
+                return
+
+            stop = min(start + PREFETCH_BATCH_SIZE, vis.num_points)
+            batch = [i for i in range(start, stop) if vis.head_radii[i] is None]
+
+            if batch:
+                batch_radii = radius.get_radius_points(vis.points[batch], vis.trimesh_mesh, n_rays=200)
+
+                # Each slot is written independently; skip any the GUI thread computed in the meantime
+                for i, head_radius in zip(batch, batch_radii):
+                    if vis.head_radii[i] is None:
+                        vis.head_radii[i] = float(head_radius)
+
+            self.progress.emit(stop)
+
+            # Give the GUI thread a chance to take the GIL before the next cast
+            self.msleep(5)
+
+
 class SpineProofreadVisualizer:
     """Interactive 3D visualizer for proofreading spine head center candidates."""
 
@@ -47,13 +118,19 @@ class SpineProofreadVisualizer:
         :param annotation: Optional list of tuples (point_array, name_str) for annotations.
         :param original_head_centers: Original head center positions (for reset functionality).
         :param dsb_filepath: Path to the DSB file for saving results.
-        :param initial_labels: Optional list of initial labels for each point.
+        :param initial_labels: Optional list of initial label strings for each point.
         :param initial_spine_names: Optional list of initial spine names.
         :param initial_radii: Optional list of initial radii for each point.
         """
         self.trimesh_mesh = mesh
         self.pv_mesh = pv.wrap(mesh)
         self.psds = pv.wrap(psds) if psds is not None else None
+
+        # The mesh never changes, so the camera offset used when focusing on a point is computed once.
+        # bounds is (xmin, xmax, ymin, ymax, zmin, zmax), so the distance is half the mesh's x extent
+        camera_distance = abs(self.pv_mesh.bounds[1] - self.pv_mesh.bounds[0]) * 0.5
+        self.camera_offset = np.array([0.0, -camera_distance, camera_distance * 0.5])
+
         self.annotation = annotation
         self.points = points
         self.original_points = original_head_centers if original_head_centers is not None else points.copy()
@@ -63,21 +140,39 @@ class SpineProofreadVisualizer:
         # State management
         self.current_index = 0
         self.num_points = len(self.points)
-        self.labels = initial_labels if initial_labels is not None else ['unlabeled'] * self.num_points
+        # Labels are int8 codes (see LABEL_NAMES); unknown saved labels fall back to unlabeled
+        if initial_labels is not None:
+            self.labels = np.array([LABEL_CODES.get(label, UNLABELED) for label in initial_labels], dtype=np.int8)
+        else:
+            self.labels = np.full(self.num_points, UNLABELED, dtype=np.int8)
 
-        # Auto-generate spine names based on closest annotation or use provided names
+        # Annotation positions as an (M, 3) array for vectorized distance queries
+        if self.annotation:
+            self.annotation_points = np.array(
+                [annotation_point for annotation_point, _ in self.annotation], dtype=np.float64
+            ).reshape(-1, 3)
+        else:
+            self.annotation_points = np.empty((0, 3))
+
+        # Spatial index over the annotations, shared by spine naming and label visibility
+        self.annotation_tree = cKDTree(self.annotation_points) if len(self.annotation_points) > 0 else None
+
+        # Auto-generate spine names based on closest annotation or use provided names. Names are kept as an
+        # object array so the output DataFrame can wrap it without copying
         if initial_spine_names is not None:
-            self.spine_names = initial_spine_names
+            self.spine_names = np.array(initial_spine_names, dtype=object)
         else:
-            self.spine_names = self._generate_spine_names()
+            self.spine_names = np.array(self._generate_spine_names(), dtype=object)
 
         # Visualization objects
         self.plotter = None
-        self.head_center_actors = []
-        self.radius_indicator_actor = None  # Placeholder
+        self.head_center_points = None  # Point set driving the head-center glyphs
+        self.head_center_actor = None
+        self.radius_indicator_actor = None  # Created in initialize_scene
         self.head_radii: list[float | None] = initial_radii if initial_radii is not None else [None] * self.num_points
-        self.annotation_actors = []  # Store annotation point actors
-        self.annotation_label_actors = []  # Store annotation label actors
+        self.annotation_actor = None  # Single glyph actor drawing all annotation points
+        self.annotation_labels = None  # Point set holding annotation names and their per-label visibility
+        self.annotation_label_actor = None  # Single actor drawing all annotation labels
 
         # GUI components
         self.text_input = None
@@ -89,97 +184,148 @@ class SpineProofreadVisualizer:
         self.last_saved_label = None  # Label to display last saved time
         self.spine_index_input = None  # Line edit for spine index navigation
         self.spine_index_go_button = None  # Go button for spine index navigation
+        self.spine_index_validate_timer = None  # Debounces validation of the spine index input
+        self.radius_prefetcher = None  # Background thread computing head radii
+        self.render_timer = None  # Single-shot timer coalescing render requests
+        self.info_text_actor = None  # Text actor for the info text in the upper left corner
+        self.camera_basis = None  # Cached camera right/up/forward matrix, reset when the camera moves
 
         # Visual settings
         self.sphere_radius = 40
+        self.unit_sphere = pv.Sphere(radius=1.0)  # Tessellated once; every sphere in the scene is a scaled copy
 
     def _generate_spine_names(self):
         """
-        Generate spine names based on closest annotation within 5000 units.
+        Generate spine names based on closest annotation within 3000 units.
         Falls back to "Spine number [idx]" if no annotation is close enough.
 
         :return: List of spine names
         """
-        names = []
+        names = [f"Spine number {i}" for i in range(self.num_points)]  # Default names
 
-        for i, point in enumerate(self.points):
-            name = f"Spine number {i}"  # Default name
+        if self.annotation_tree is None or self.num_points == 0:
+            return names
 
-            if self.annotation is not None and len(self.annotation) > 0:
-                # Find the closest annotation
-                min_distance = float('inf')
-                closest_annotation_name = None
+        annotation_names = [annotation_name for _, annotation_name in self.annotation]
 
-                for annotation_point, annotation_name in self.annotation:
-                    distance = np.linalg.norm(point - annotation_point)
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_annotation_name = annotation_name
+        # Annotations farther than the bound come back with an infinite distance. The tree prunes on squared
+        # distances internally and only takes a square root for the single neighbor it returns per point
+        distances, closest = self.annotation_tree.query(self.points, k=1, distance_upper_bound=3000)
 
-                if min_distance < 3000:
-                    name = closest_annotation_name
-
-            names.append(name)
+        for i in np.flatnonzero(np.isfinite(distances)):
+            names[i] = annotation_names[closest[i]]
 
         return names
 
     def get_sphere_color(self, index):
-        """Get color for sphere based on its label and if it's current."""
+        """Get the 8-bit RGB color for sphere based on its label and if it's current."""
         label = self.labels[index]
 
-        if label == "accepted":
-            return "green"
-
-        if label == "rejected":
-            return "red"
+        if label == UNLABELED and index == self.current_index:
+            return COLOR_RGB["blue"]
 
-        if index == self.current_index:
-            return "blue"
-
-        return "gray"
+        return LABEL_COLORS[label]
 
     def update_sphere_color(self, index):
         """Update the color of a sphere based on its label."""
         if self.plotter is None:
             return
 
-        color = self.get_sphere_color(index)
-        self.plotter.remove_actor(self.head_center_actors[index])
-
-        sphere = pv.Sphere(radius=self.sphere_radius, center=self.points[index])
-        self.head_center_actors[index] = self.plotter.add_mesh(sphere, color=color, opacity=1.0)
+        # Update the glyph's point and color in place; the glyph mapper picks the change up on the next render
+        self.head_center_points.points[index] = self.points[index]
+        self.head_center_points.point_data['colors'][index] = self.get_sphere_color(index)
+        self.head_center_points.Modified()
 
         self._update_radius_indicator()
 
     def get_radius_for_point(self, index) -> float:
+        # Usually already filled in by the background prefetcher; only compute synchronously on a miss
         if self.head_radii[index] is None:
-            self.head_radii[index] = radius.get_radius_point(
-                self.points[index], self.trimesh_mesh, n_rays=200
-            )
+            self.compute_radii_near(index)
 
         return self.head_radii[index]
 
+    def compute_radii_near(self, index):
+        """
+        Compute the radius at index together with the uncached radii of the points right around it in navigation
+        order. The cast blocks the GUI thread, so it is capped at PREFETCH_BATCH_SIZE points and the rest are left to
+        the background prefetcher.
+
+        :param index: Index of the point whose radius is needed.
+        """
+        # Mostly points ahead of index, since navigation usually moves forward
+        behind = PREFETCH_BATCH_SIZE // 4
+        window = (index + np.arange(-behind, PREFETCH_BATCH_SIZE - behind)) % self.num_points
+        batch = [index % self.num_points] + [
+            i for i in dict.fromkeys(window.tolist()) if i != index % self.num_points and self.head_radii[i] is None
+        ]
+
+        batch_radii = radius.get_radius_points(self.points[batch], self.trimesh_mesh, n_rays=200)
+
+        for i, head_radius in zip(batch, batch_radii):
+            self.head_radii[i] = float(head_radius)
+
+    def compute_missing_radii(self):
+        """
+        Compute all head radii that are not cached yet. Points are ray cast in batches on the GUI thread, and the
+        progress dialog is updated and Qt events are processed between batches. The casts are not spread across a
+        thread pool, since ncollpyde holds the GIL for the duration of each cast.
+        """
+        missing = [i for i, head_radius in enumerate(self.head_radii) if head_radius is None]
+        if not missing:
+            return
+
+        progress = QtWidgets.QProgressDialog("Computing head radii...", None, 0, len(missing), self.main_window)
+        progress.setWindowTitle("Saving")
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(500)
+
+        for start in range(0, len(missing), RADIUS_BATCH_SIZE):
+            batch = missing[start:start + RADIUS_BATCH_SIZE]
+            batch_radii = radius.get_radius_points(self.points[batch], self.trimesh_mesh, n_rays=200)
+
+            for i, head_radius in zip(batch, batch_radii):
+                self.head_radii[i] = float(head_radius)
+
+            progress.setValue(start + len(batch))
+            QtWidgets.QApplication.processEvents()
+
+        progress.close()
+
+    def start_radius_prefetch(self):
+        """Start computing all missing head radii in a background thread."""
+        if all(head_radius is not None for head_radius in self.head_radii):
+            return
+
+        self.radius_prefetcher = RadiusPrefetcher(self)
+        self.radius_prefetcher.progress.connect(self.on_radius_prefetch_progress)
+        self.radius_prefetcher.start(QtCore.QThread.LowPriority)
+
+    def stop_radius_prefetch(self):
+        """Stop the background radius prefetcher, waiting for its current batch to finish."""
+        if self.radius_prefetcher is not None:
+            self.radius_prefetcher.requestInterruption()
+            self.radius_prefetcher.wait()
+            self.radius_prefetcher = None
+
+    def on_radius_prefetch_progress(self, processed):
+        """Called from the prefetcher each time a batch of radii is done."""
+        log.debug("Head radii prefetched for %d/%d points", processed, self.num_points)
+
     def _update_radius_indicator(self):
         """Update radius indicator to show for this point."""
-        head_radius = self.get_radius_for_point(self.current_index)
+        if self.radius_indicator_actor is None:
+            return
 
-        radius_sphere = pv.Sphere(
-            radius=head_radius,
-            center=self.points[self.current_index],
-        )
+        head_radius = self.get_radius_for_point(self.current_index)
 
-        if self.radius_indicator_actor is not None:
-            self.plotter.remove_actor(self.radius_indicator_actor)
-
-        self.radius_indicator_actor = self.plotter.add_mesh(
-            radius_sphere,
-            color="blue",
-            opacity=0.2,
-        )
+        # The indicator is a unit sphere, so scaling it by the radius resizes it without re-tessellating
+        self.radius_indicator_actor.SetScale(head_radius, head_radius, head_radius)
+        self.radius_indicator_actor.SetPosition(*self.points[self.current_index])
 
     def update_info_text(self):
         """Update the information text display."""
-        label = self.labels[self.current_index]
+        label = LABEL_NAMES[self.labels[self.current_index]]
 
         # Get current radius (compute if not available yet)
         current_radius = self.get_radius_for_point(self.current_index)
@@ -198,12 +344,8 @@ class SpineProofreadVisualizer:
             f"  Ctrl/Cmd S: Save results"
         )
 
-        self.plotter.add_text(
-            info_text,
-            position='upper_left',
-            font_size=10,
-            name='info_text'
-        )
+        # Update the existing text actor in place instead of replacing it
+        self.info_text_actor.set_text('upper_left', info_text)
 
     def focus_on_current_sphere(self, move_camera=True):
         """Focus on the current sphere."""
@@ -215,12 +357,23 @@ class SpineProofreadVisualizer:
         if move_camera:
             point = self.points[self.current_index]
             self.plotter.camera.focal_point = point
-
-            distance = np.linalg.norm(self.pv_mesh.bounds[1] - self.pv_mesh.bounds[0]) * 0.5
-            self.plotter.camera.position = point + np.array([0, -distance, distance * 0.5])
+            self.plotter.camera.position = point + self.camera_offset
             self.plotter.camera.view_up = [0, 0, 1]
 
-        self.plotter.render()
+        self.request_render()
+
+    def request_render(self):
+        """
+        Schedule a render. Requests arriving before the timer fires (e.g. from a held-down key)
+        are merged into a single redraw.
+        """
+        if self.plotter is None:
+            return
+
+        if self.render_timer is None:
+            self.plotter.render()
+        elif not self.render_timer.isActive():
+            self.render_timer.start()
 
     def go_to_sphere(self, index):
         """
@@ -238,14 +391,14 @@ class SpineProofreadVisualizer:
 
     def mark_accepted(self):
         """Mark current point as accepted."""
-        self.labels[self.current_index] = 'accepted'
+        self.labels[self.current_index] = ACCEPTED
         self.has_unsaved_changes = True
         self.update_sphere_color(self.current_index)
         self.focus_on_current_sphere(move_camera=False)
 
     def mark_rejected(self):
         """Mark current point as rejected."""
-        self.labels[self.current_index] = 'rejected'
+        self.labels[self.current_index] = REJECTED
         self.has_unsaved_changes = True
         self.update_sphere_color(self.current_index)
         self.focus_on_current_sphere(move_camera=False)
@@ -264,31 +417,33 @@ class SpineProofreadVisualizer:
     def save_results(self):
         """Save labeled points to CSV file and to DSB file with timestamp."""
         # Compute any missing head radii
-        for i in range(self.num_points):
-            self.get_radius_for_point(i)  # Getting radius also computes and stores it if not already done
+        self.compute_missing_radii()
 
         output_data = {
             'Index': np.arange(self.num_points),
             'Name': self.spine_names,
-            'Radius': self.head_radii,
+            'Radius': np.asarray(self.head_radii, dtype=np.float64),
             'PosX': self.points[:, 0],
             'PosY': self.points[:, 1],
             'PosZ': self.points[:, 2],
-            'status': self.labels
+            'status': LABEL_NAMES[self.labels]
         }
-        output_df = pd.DataFrame(output_data)
+        output_df = pd.DataFrame(output_data, copy=False)
+
+        # Serialize once and write the same bytes to both destinations
+        csv_bytes = output_df.to_csv(index=False, lineterminator='\n').encode('utf-8')
 
         # Save to regular CSV file (legacy behavior)
-        output_df.to_csv(self.output_path, index=False)
-        print(f"\nResults saved to: {self.output_path}")
+        Path(self.output_path).write_bytes(csv_bytes)
+        log.info("Results saved to: %s", self.output_path)
 
         # Save to DSB file with timestamp
         if self.dsb_filepath is not None:
             base_filename = Path(self.dsb_filepath).stem + "_proofread"
-            csv_filename = payload.save_csv_to_dsb(self.dsb_filepath, output_df, base_filename)
-            print(f"Results also saved to DSB file as: {csv_filename}")
+            csv_filename = payload.save_csv_to_dsb(self.dsb_filepath, csv_bytes, base_filename)
+            log.info("Results also saved to DSB file as: %s", csv_filename)
         else:
-            print("Warning: DSB filepath not provided, skipping DSB save.")
+            log.warning("DSB filepath not provided, skipping DSB save.")
 
         # Update save tracking
         self.last_saved_time = datetime.now()
@@ -301,19 +456,8 @@ class SpineProofreadVisualizer:
 
         :param offset: A 3D vector indicating where to move along. Where +z = forward, +y = up
         """
-        camera_pos = np.array(self.plotter.camera.position)
-        camera_fp = np.array(self.plotter.camera.focal_point)
-        direction = camera_fp - camera_pos
-
         # Calculate the step based on camera orientation
-        direction = direction / np.linalg.norm(direction)
-        up = np.array(self.plotter.camera.GetViewUp())
-        right = np.cross(direction, up)
-        right = right / np.linalg.norm(right)
-        up = np.cross(right, direction)
-        up = up / np.linalg.norm(up)
-
-        step = offset[0] * right + offset[1] * up + offset[2] * direction
+        step = self.get_camera_basis() @ offset
         self.points[self.current_index] += step
 
         # Update visualization
@@ -323,6 +467,28 @@ class SpineProofreadVisualizer:
 
         self.focus_on_current_sphere(move_camera=False)
 
+    def get_camera_basis(self):
+        """
+        Get the camera's orientation as a 3x3 matrix whose columns are the unit right, up and forward vectors.
+        The matrix is cached until the camera is modified.
+        """
+        if self.camera_basis is None:
+            camera = self.plotter.camera
+
+            forward = np.subtract(camera.GetFocalPoint(), camera.GetPosition())
+            forward /= math.sqrt(forward @ forward)
+            right = np.cross(forward, camera.GetViewUp())
+            right /= math.sqrt(right @ right)
+            up = np.cross(right, forward)  # Already unit length since right and forward are orthonormal
+
+            self.camera_basis = np.column_stack((right, up, forward))
+
+        return self.camera_basis
+
+    def on_camera_modified(self, *_):
+        """Called by VTK whenever the camera changes; drops the cached camera basis."""
+        self.camera_basis = None
+
     def update_last_saved_label(self):
         """Update the last saved time label."""
         if self.last_saved_label is not None and self.last_saved_time is not None:
@@ -364,6 +530,11 @@ class SpineProofreadVisualizer:
 
     def on_spine_index_go_clicked(self):
         """Handle clicking the Go button to navigate to a specific spine index."""
+        # Apply a pending debounced validation first so the button state matches the current text
+        if self.spine_index_validate_timer is not None and self.spine_index_validate_timer.isActive():
+            self.spine_index_validate_timer.stop()
+            self.validate_spine_index_input()
+
         # Only proceed if the button is enabled
         if not self.spine_index_go_button.isEnabled():
             return
@@ -396,6 +567,9 @@ class SpineProofreadVisualizer:
         else:
             event.accept()
 
+        if event.isAccepted():
+            self.stop_radius_prefetch()
+
     def setup_key_callbacks(self):
         """Setup keyboard event handlers for movement controls only."""
         # Clear default wireframe toggle
@@ -428,52 +602,94 @@ class SpineProofreadVisualizer:
         self.plotter.iren.add_key_event('o', create_callback(lambda: self.bump(np.array([0, 15, 0]))))
         self.plotter.iren.add_key_event('O', create_callback(lambda: self.bump(np.array([0, 65, 0]))))
 
+    def make_sphere_glyph_actor(self, points, sphere_radius):
+        """
+        Create an actor drawing a sphere at every point, all instanced from the shared unit sphere.
+
+        :param points: A pyvista.PolyData whose points are the sphere centers.
+        :param sphere_radius: Radius of every sphere.
+        :return: A pyvista.Actor using a vtkGlyph3DMapper.
+        """
+        glyph_mapper = vtkGlyph3DMapper()
+        glyph_mapper.SetInputData(points)
+        glyph_mapper.SetSourceData(self.unit_sphere)
+        glyph_mapper.ScalingOn()
+        glyph_mapper.SetScaleModeToNoDataScaling()
+        glyph_mapper.SetScaleFactor(sphere_radius)
+        glyph_mapper.OrientOff()
+        return pv.Actor(mapper=glyph_mapper)
+
     def initialize_scene(self):
         """Initialize the 3D scene with mesh and points."""
         # Add mesh
-        self.plotter.add_mesh(self.pv_mesh, opacity=0.5, color='white')
+        self.plotter.add_mesh(self.pv_mesh, opacity=0.5, color=COLOR_RGB['white'], render=False)
 
         # Add PSDs mesh if available (desaturated orange with 80% opacity)
         if self.psds is not None:
-            self.plotter.add_mesh(self.psds, opacity=0.8, color='#D4A574')
+            self.plotter.add_mesh(self.psds, opacity=0.8, color='#D4A574', render=False)
+
+        # Add all points as spheres through a single glyph actor, colored per point by an RGB array
+        self.head_center_points = pv.PolyData(np.array(self.points, dtype=float))
+        self.head_center_points.point_data['colors'] = LABEL_COLORS[self.labels]
+
+        self.head_center_actor = self.make_sphere_glyph_actor(self.head_center_points, self.sphere_radius)
+        glyph_mapper = self.head_center_actor.GetMapper()
+        glyph_mapper.SetScalarModeToUsePointFieldData()
+        glyph_mapper.SelectColorArray('colors')
+        glyph_mapper.SetColorModeToDirectScalars()
+        self.plotter.add_actor(self.head_center_actor, name='head_centers', render=False)
 
-        # Add all points as spheres
-        for i, point in enumerate(self.points):
-            color = self.get_sphere_color(i)
-            sphere = pv.Sphere(radius=self.sphere_radius, center=point)
-            actor = self.plotter.add_mesh(sphere, color=color, opacity=1.0)
-            self.head_center_actors.append(actor)
+        # Add the radius indicator once; it is moved and scaled onto the current point
+        self.radius_indicator_actor = self.plotter.add_mesh(
+            self.unit_sphere,
+            color=COLOR_RGB["blue"],
+            opacity=0.2,
+            name='radius_indicator',
+            render=False,
+        )
 
         # Show radius indicator for the first point
         self.update_sphere_color(self.current_index)
 
-        # Add annotation points and labels if available
-        if self.annotation is not None:
-            for annotation_point, annotation_name in self.annotation:
-                # Add small sphere for annotation point (yellow/gold color)
-                annotation_sphere = pv.Sphere(radius=self.sphere_radius * 0.5, center=annotation_point)
-                annotation_actor = self.plotter.add_mesh(
-                    annotation_sphere,
-                    color='gold',
-                    opacity=0.9
-                )
-                self.annotation_actors.append(annotation_actor)
-
-                # Add billboarded text label that always faces the camera
-                label_actor = self.plotter.add_point_labels(
-                    [annotation_point],
-                    [annotation_name],
-                    font_size=14,
-                    text_color='white',
-                    point_color='gold',
-                    point_size=0,  # Don't show the point itself (we have the sphere)
-                    render_points_as_spheres=False,
-                    always_visible=True,
-                    shape_opacity=0.7,
-                    fill_shape=True,
-                    shape_color='black'
-                )
-                self.annotation_label_actors.append(label_actor)
+        # Add small spheres for annotation points (yellow/gold color)
+        if len(self.annotation_points) > 0:
+            self.annotation_actor = self.make_sphere_glyph_actor(
+                pv.PolyData(self.annotation_points.copy()), self.sphere_radius * 0.5
+            )
+            self.annotation_actor.GetMapper().ScalarVisibilityOff()
+            self.annotation_actor.prop.color = COLOR_RGB['gold']
+            self.annotation_actor.prop.opacity = 0.9
+            self.plotter.add_actor(self.annotation_actor, name='annotations', render=False)
+
+        if len(self.annotation_points) > 0:
+            # All labels share one point set; a per-point "visible" flag filters which ones reach the label mapper
+            self.annotation_labels = pv.PolyData(self.annotation_points.copy())
+            self.annotation_labels.point_data['names'] = np.array(
+                [str(annotation_name) for _, annotation_name in self.annotation]
+            )
+            self.annotation_labels.point_data['visible'] = np.zeros(len(self.annotation_points), dtype=np.uint8)
+
+            visible_labels = vtkThresholdPoints()
+            visible_labels.SetInputData(self.annotation_labels)
+            visible_labels.SetInputArrayToProcess(0, 0, 0, vtkDataObject.FIELD_ASSOCIATION_POINTS, 'visible')
+            visible_labels.ThresholdByUpper(1)
+
+            # Add billboarded text labels that always face the camera
+            self.annotation_label_actor = self.plotter.add_point_labels(
+                visible_labels,
+                'names',
+                font_size=14,
+                text_color='white',
+                show_points=False,  # Don't show the points themselves (we have the spheres)
+                always_visible=True,
+                shape_opacity=0.7,
+                fill_shape=True,
+                shape_color='black',
+                name='annotation_labels',
+                render=False,
+            )
+            # Draw overlapping labels too rather than letting the placement mapper drop them
+            self.annotation_label_actor.GetMapper().PlaceAllLabelsOn()
 
         self.update_annotation_label_visibility()
 
@@ -492,24 +708,25 @@ class SpineProofreadVisualizer:
 
     def update_annotation_label_visibility(self):
         """Update visibility of annotation labels based on distance to current point."""
-        if self.annotation is None or not self.annotation_label_actors:
+        if self.annotation_labels is None:
             return
 
-        current_point = self.points[self.current_index]
+        if self.close_labels_only:
+            visible = np.zeros(len(self.annotation_points), dtype=np.uint8)
+            visible[self.annotation_tree.query_ball_point(self.points[self.current_index], 6000)] = 1
+        else:
+            # Show all labels
+            visible = np.ones(len(self.annotation_points), dtype=np.uint8)
 
-        for i, (annotation_point, annotation_name) in enumerate(self.annotation):
-            distance = np.linalg.norm(current_point - annotation_point)
+        visible_array = self.annotation_labels.point_data['visible']
 
-            if self.close_labels_only:
-                if distance < 6000:
-                    self.annotation_label_actors[i].SetVisibility(True)
-                else:
-                    self.annotation_label_actors[i].SetVisibility(False)
-            else:
-                # Show all labels
-                self.annotation_label_actors[i].SetVisibility(True)
+        # Skip the render when no label changed visibility
+        if np.array_equal(visible, visible_array):
+            return
 
-        self.plotter.render()
+        visible_array[:] = visible
+        self.annotation_labels.Modified()
+        self.request_render()
 
     def toggle_close_labels_only(self, checked):
         """Toggle between showing all labels or only close labels."""
@@ -601,6 +818,15 @@ class SpineProofreadVisualizer:
         self.plotter = QtInteractor(central_widget)
         layout.addWidget(self.plotter.interactor)
 
+        # Coalesce renders to at most one per frame (~60 fps)
+        self.render_timer = QtCore.QTimer(self.main_window)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(16)
+        self.render_timer.timeout.connect(self.plotter.render)
+
+        # Invalidate the cached camera basis whenever the camera moves
+        self.plotter.camera.AddObserver("ModifiedEvent", self.on_camera_modified)
+
         # Create text input at the bottom
         text_layout = QtWidgets.QHBoxLayout()
         label = QtWidgets.QLabel("Spine Name:")
@@ -626,8 +852,14 @@ class SpineProofreadVisualizer:
         self.spine_index_input.setText("1")
         self.spine_index_input.setPlaceholderText("Index")
 
+        # Validate once typing pauses rather than on every keystroke
+        self.spine_index_validate_timer = QtCore.QTimer(self.main_window)
+        self.spine_index_validate_timer.setSingleShot(True)
+        self.spine_index_validate_timer.setInterval(100)
+        self.spine_index_validate_timer.timeout.connect(self.validate_spine_index_input)
+
         # Connect text changed event for validation
-        self.spine_index_input.textChanged.connect(lambda: self.validate_spine_index_input())
+        self.spine_index_input.textChanged.connect(lambda: self.spine_index_validate_timer.start())
 
         # Connect Enter key to trigger Go button (only when enabled)
         self.spine_index_input.returnPressed.connect(self.on_spine_index_go_clicked)
@@ -653,7 +885,9 @@ class SpineProofreadVisualizer:
         layout.addLayout(spine_nav_layout)
 
         # Add loading text
-        self.plotter.add_text("Loading...", position='upper_left', font_size=10, name='info_text')
+        self.info_text_actor = self.plotter.add_text(
+            "Loading...", position='upper_left', font_size=10, name='info_text', render=False
+        )
 
         # Initialize scene and callbacks
         self.initialize_scene()
@@ -670,5 +904,8 @@ class SpineProofreadVisualizer:
         self.main_window.resize(1024, 768)
         self.main_window.show()
 
+        # Fill in the remaining head radii while the user works
+        self.start_radius_prefetch()
+
         # Start the Qt event loop
         app.exec_()